@@ -1,11 +1,58 @@
 from __future__ import annotations
 
-from typing import Iterable, Sequence, Tuple
+from typing import Dict, Sequence, Tuple
 
 import numpy as np
-from PyQt5.QtCore import QPointF, QRectF, Qt
-from PyQt5.QtGui import QColor, QImage, QPainter, QPen, QPolygonF
+from PyQt5.QtCore import PYQT_VERSION, QLineF, QPointF, QRectF, Qt, QTimer
+from PyQt5.QtGui import QBrush, QColor, QImage, QPainter, QPen, QPixmap, QPolygonF, QTransform
 from PyQt5.QtWidgets import QWidget
+from shapely.geometry import LineString
+
+from .geometry import points_to_array
+
+
+# QPolygonF(int) plus a resizable sip.voidptr from data() lets us write the
+# point buffer directly; older bindings get the per-point QPointF path.
+_BUFFER_BACKED_POLYGONS = PYQT_VERSION >= 0x050B00
+
+
+def polygon_from_array(points: np.ndarray) -> QPolygonF:
+    arr = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    n = arr.shape[0]
+    if not _BUFFER_BACKED_POLYGONS:
+        return QPolygonF([QPointF(float(x), float(y)) for x, y in arr])
+    polygon = QPolygonF(n)
+    if n == 0:
+        return polygon
+    buffer = polygon.data()
+    buffer.setsize(2 * n * np.dtype(np.float64).itemsize)
+    np.frombuffer(buffer, dtype=np.float64, count=2 * n).reshape(n, 2)[:] = arr
+    return polygon
+
+
+SCENE_BOUNDS_PADDING = 8.0
+
+# Dense generated polylines are thinned to half a device pixel before they are
+# handed to QPainter; the tolerance follows zoom and the device pixel ratio so
+# detail reappears on zoom-in and on HiDPI screens.
+SIMPLIFY_TOLERANCE_PX = 0.5
+SIMPLIFIED_LAYERS = frozenset({"centerline", "left_boundary", "right_boundary"})
+
+SCENE_LAYERS = (
+    "allowed_area",
+    "control_points",
+    "centerline",
+    "left_boundary",
+    "right_boundary",
+    "left_cones",
+    "right_cones",
+)
+
+# How long after the last wheel step the background keeps its fast scaling.
+ZOOM_SETTLE_MS = 150
+
+# Drag moves are coalesced to roughly one update per display frame (~120 Hz).
+DRAG_COALESCE_MS = 8
 
 
 class TrackCanvas(QWidget):
@@ -22,13 +69,14 @@ class TrackCanvas(QWidget):
 
         self.background_kind = "grid"
         self.background_image = QImage()
+        self._background_image_path = ""
         self.background_width = 1600
         self.background_height = 1200
         self.px_per_m = 10.0
         self.grid_spacing_m = 1.0
 
-        self.allowed_area = []
-        self.control_points = []
+        self.allowed_area = np.empty((0, 2), dtype=float)
+        self.control_points = np.empty((0, 2), dtype=float)
         self.centerline = None
         self.left_boundary = None
         self.right_boundary = None
@@ -36,6 +84,90 @@ class TrackCanvas(QWidget):
         self.right_cones = None
         self.edit_target = "area"
         self.transform_gizmo = None
+        self._layer_sources = {}
+        self._map_coords = np.empty((0, 2), dtype=np.float64)
+        self._layer_ranges = {}
+
+        # Layer polygons and bounds are kept in map coordinates, so they
+        # survive resizes, pans and zooms and are only dropped per layer when
+        # the layer itself changes.
+        self._layer_bounds_cache = {}
+        self._layer_polygons = {}
+        self._map_transform_key = None
+        self._map_transform_cache = QTransform()
+        self._scaled_background_key = None
+        self._scaled_background = QImage()
+        self._base_pixmap_key = None
+        self._base_pixmap_cache = QPixmap()
+        self._zoom_settle_timer = QTimer(self)
+        self._zoom_settle_timer.setSingleShot(True)
+        self._zoom_settle_timer.timeout.connect(self.update)
+        self._pending_drag_pos = None
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.timeout.connect(self._flush_pending_drag)
+
+        self._init_paint_resources()
+
+    def _init_paint_resources(self):
+        # Pens, brushes and colours are built once; paint code only selects them.
+        self._view_fill = QColor(235, 235, 235)
+        self._grid_fill = QColor(249, 246, 236)
+        self._pen_grid_minor = QPen(QColor(223, 220, 210), 1)
+        self._pen_grid_major = QPen(QColor(186, 182, 170), 1)
+        self._pen_grid_border = QPen(QColor(120, 120, 120), 1)
+
+        self._pen_area = QPen(QColor(180, 65, 0), 2)
+        self._brush_area = QBrush(QColor(255, 177, 110, 70))
+        self._pen_centerline = QPen(QColor(16, 132, 86), 2, Qt.DashLine)
+        self._pen_left_boundary = QPen(QColor(0, 76, 255), 2)
+        self._pen_right_boundary = QPen(QColor(222, 186, 0), 2)
+        self._pen_left_cone_ring = QPen(QColor(0, 76, 255), 1)
+        self._pen_right_cone_ring = QPen(QColor(222, 186, 0), 1)
+        self._map_space_pens = [
+            (pen, pen.widthF())
+            for pen in (
+                self._pen_area,
+                self._pen_centerline,
+                self._pen_left_boundary,
+                self._pen_right_boundary,
+                self._pen_left_cone_ring,
+                self._pen_right_cone_ring,
+            )
+        ]
+
+        self._color_area_active = QColor(255, 140, 0)
+        self._color_area_inactive = QColor(209, 157, 88)
+        self._color_left_cone = QColor(0, 76, 255)
+        self._color_right_cone = QColor(222, 186, 0)
+        self._color_track_active = QColor(48, 176, 96)
+        self._color_track_inactive = QColor(108, 156, 118)
+        self._marker_outline = QColor(0, 0, 0)
+        self._marker_pen_cache = {}
+
+        self._color_gizmo_x = QColor(191, 66, 66)
+        self._color_gizmo_y = QColor(52, 109, 191)
+        self._pen_gizmo_x = QPen(self._color_gizmo_x, 2)
+        self._pen_gizmo_y = QPen(self._color_gizmo_y, 2)
+        self._pen_gizmo_rotate = QPen(QColor(76, 76, 76), 2, Qt.DashLine)
+        self._pen_gizmo_outline = QPen(QColor(35, 35, 35), 1)
+        self._brush_gizmo_center = QBrush(QColor(255, 255, 255))
+        self._brush_gizmo_x = QBrush(self._color_gizmo_x)
+        self._brush_gizmo_y = QBrush(self._color_gizmo_y)
+        self._brush_gizmo_rotate = QBrush(QColor(91, 44, 143))
+
+    def _marker_pens(self, fill: QColor, radius: int) -> Tuple[QPen, QPen]:
+        key = (fill.rgba(), radius)
+        pens = self._marker_pen_cache.get(key)
+        if pens is None:
+            scale = self._map_scale()
+            outline_pen = QPen(self._marker_outline, (2.0 * radius + 1.0) / scale)
+            outline_pen.setCapStyle(Qt.RoundCap)
+            fill_pen = QPen(fill, (2.0 * radius - 1.0) / scale)
+            fill_pen.setCapStyle(Qt.RoundCap)
+            pens = (outline_pen, fill_pen)
+            self._marker_pen_cache[key] = pens
+        return pens
 
     def reset_view(self):
         self.zoom = 1.0
@@ -54,21 +186,38 @@ class TrackCanvas(QWidget):
         self.background_kind = kind
         self.px_per_m = float(px_per_m)
         self.grid_spacing_m = max(0.1, float(grid_spacing_m))
-        self.background_image = QImage()
         if kind == "location" and image_path:
-            image = QImage(image_path)
-            if not image.isNull():
-                self.background_image = image
-                self.background_width = image.width()
-                self.background_height = image.height()
+            # Decoding the satellite image is the expensive part of a background
+            # switch; keep the decoded (and pre-scaled) image when the same file
+            # is applied again, e.g. on project reload.
+            if image_path != self._background_image_path or self.background_image.isNull():
+                self._set_background_image(QImage(image_path), image_path)
+            if not self.background_image.isNull():
+                self.background_width = self.background_image.width()
+                self.background_height = self.background_image.height()
             else:
                 self.background_width = width_px
                 self.background_height = height_px
         else:
+            self._set_background_image(QImage(), "")
             self.background_width = width_px
             self.background_height = height_px
+        self._base_pixmap_key = None
         self.update()
 
+    def _set_background_image(self, image: QImage, image_path: str):
+        if not image.isNull():
+            # Raster paint engines blit premultiplied/RGB32 directly; anything
+            # else (PNGs decode to plain ARGB32) is converted on every draw, so
+            # convert once here unless the image is already in a native format.
+            target = QImage.Format_ARGB32_Premultiplied if image.hasAlphaChannel() else QImage.Format_RGB32
+            if image.format() != target:
+                image = image.convertToFormat(target)
+        self.background_image = image if not image.isNull() else QImage()
+        self._background_image_path = image_path if not image.isNull() else ""
+        self._scaled_background_key = None
+        self._scaled_background = QImage()
+
     def background_dimensions(self) -> Tuple[int, int]:
         return int(self.background_width), int(self.background_height)
 
@@ -84,16 +233,82 @@ class TrackCanvas(QWidget):
         edit_target: str,
         transform_gizmo=None,
     ):
-        self.allowed_area = list(allowed_area)
-        self.control_points = list(control_points)
-        self.centerline = centerline
-        self.left_boundary = left_boundary
-        self.right_boundary = right_boundary
-        self.left_cones = left_cones
-        self.right_cones = right_cones
+        # Layers are normalized to (N, 2) float arrays once here so painting
+        # never has to branch on tuples, lists or QPointF per vertex.
+        allowed_area = points_to_array(allowed_area)
+        control_points = points_to_array(control_points)
+        changed = []
+        if not np.array_equal(allowed_area, self.allowed_area):
+            changed.append("allowed_area")
+        if not np.array_equal(control_points, self.control_points):
+            changed.append("control_points")
+        track_layers = {
+            "centerline": centerline,
+            "left_boundary": left_boundary,
+            "right_boundary": right_boundary,
+            "left_cones": left_cones,
+            "right_cones": right_cones,
+        }
+        for layer, value in track_layers.items():
+            if value is not self._layer_sources.get(layer):
+                changed.append(layer)
+        full_repaint = edit_target != self.edit_target or bool(transform_gizmo or self.transform_gizmo)
+
+        dirty = QRectF()
+        for layer in changed:
+            dirty = dirty.united(self._padded_layer_bounds(layer))
+            self._invalidate_layer(layer)
+
+        self.allowed_area = allowed_area
+        self.control_points = control_points
+        for layer in changed:
+            if layer in track_layers:
+                value = track_layers[layer]
+                self._layer_sources[layer] = value
+                setattr(self, layer, points_to_array(value) if value is not None else None)
+        if changed:
+            self._pack_layers()
         self.edit_target = edit_target
         self.transform_gizmo = transform_gizmo
-        self.update()
+
+        if full_repaint:
+            self.update()
+            return
+        for layer in changed:
+            dirty = dirty.united(self._padded_layer_bounds(layer))
+        if not dirty.isEmpty():
+            self.update(self._layer_transform().mapRect(dirty).toAlignedRect())
+
+    def _pack_layers(self):
+        # All layers share one contiguous (M, 2) buffer with per-layer
+        # [start, stop) ranges; the layer attributes become views into it.
+        present = [(layer, getattr(self, layer)) for layer in SCENE_LAYERS if getattr(self, layer) is not None]
+        offsets = np.zeros(len(present) + 1, dtype=np.int32)
+        offsets[1:] = np.cumsum([points.shape[0] for _, points in present])
+        coords = np.empty((int(offsets[-1]), 2), dtype=np.float64)
+        self._layer_ranges = {}
+        for k, (layer, points) in enumerate(present):
+            start, stop = int(offsets[k]), int(offsets[k + 1])
+            coords[start:stop] = points
+            self._layer_ranges[layer] = (start, stop)
+            setattr(self, layer, coords[start:stop])
+        self._map_coords = coords
+        self._layer_bounds_cache = self._packed_bounds(present, offsets)
+
+    def _packed_bounds(self, present, offsets: np.ndarray) -> Dict[str, QRectF]:
+        # One segmented min/max over the packed buffer yields every layer's
+        # bounds at once instead of a separate reduction per layer.
+        bounds = {layer: QRectF() for layer, _ in present}
+        starts = offsets[:-1]
+        nonempty = starts < offsets[1:]
+        if not nonempty.any():
+            return bounds
+        lo = np.minimum.reduceat(self._map_coords, starts[nonempty], axis=0)
+        hi = np.maximum.reduceat(self._map_coords, starts[nonempty], axis=0)
+        layers = [layer for (layer, _), keep in zip(present, nonempty) if keep]
+        for layer, (x0, y0), (x1, y1) in zip(layers, lo, hi):
+            bounds[layer] = QRectF(x0, y0, x1 - x0, y1 - y0)
+        return bounds
 
     def _background_rect(self) -> QRectF:
         bg_w, bg_h = self.background_dimensions()
@@ -106,29 +321,110 @@ class TrackCanvas(QWidget):
         offset_y = (self.height() - draw_h) / 2.0
         return QRectF(offset_x, offset_y, draw_w, draw_h)
 
-    def _map_points_to_scene(self, points: Iterable[Sequence[float]], rect: QRectF | None = None):
-        rect = rect or self._background_rect()
-        bg_w, bg_h = self.background_dimensions()
-        if bg_w <= 0 or bg_h <= 0:
-            return []
-
-        arr = np.asarray(points, dtype=float)
-        if arr.size == 0:
-            return []
-        arr = arr.reshape(-1, 2)
-
-        scale_x = rect.width() / bg_w
-        scale_y = rect.height() / bg_h
-        mapped = np.empty_like(arr)
-        mapped[:, 0] = rect.x() + arr[:, 0] * scale_x
-        mapped[:, 1] = rect.y() + arr[:, 1] * scale_y
-        return [QPointF(float(x), float(y)) for x, y in mapped]
+    def _map_transform(self) -> QTransform:
+        # Map pixels to scene coordinates. The background is fitted with one
+        # uniform scale, so this is a single scale plus offset that Qt applies
+        # during rasterization; layer geometry stays in map coordinates.
+        key = (self.width(), self.height()) + self.background_dimensions()
+        if key != self._map_transform_key:
+            rect = self._background_rect()
+            bg_w, _ = self.background_dimensions()
+            scale = rect.width() / bg_w if bg_w > 0 else 1.0
+            if scale <= 0.0:
+                # A collapsed widget shows nothing; keep a unit scale so pen
+                # widths and bounds padding stay finite until it has a size.
+                scale = 1.0
+            self._map_transform_cache = QTransform(scale, 0.0, 0.0, scale, rect.x(), rect.y())
+            self._map_transform_key = key
+            self._apply_pen_scale(scale)
+        return self._map_transform_cache
+
+    def _map_scale(self) -> float:
+        return self._map_transform().m11()
+
+    def _view_transform(self) -> QTransform:
+        return QTransform(self.zoom, 0.0, 0.0, self.zoom, self.pan.x(), self.pan.y())
+
+    def _layer_transform(self) -> QTransform:
+        return self._map_transform() * self._view_transform()
+
+    def _apply_pen_scale(self, scale: float):
+        # Pens are applied under the map transform, so their widths are given
+        # in map pixels to keep the on-scene stroke widths unchanged.
+        for pen, width in self._map_space_pens:
+            pen.setWidthF(width / scale)
+        self._marker_pen_cache.clear()
+
+    def _invalidate_layer(self, layer: str):
+        self._layer_polygons.pop((layer, False), None)
+        self._layer_polygons.pop((layer, True), None)
+
+    def _layer_array(self, layer: str) -> np.ndarray:
+        start, stop = self._layer_ranges.get(layer, (0, 0))
+        return self._map_coords[start:stop]
+
+    def _layer_polygon(self, layer: str, closed: bool = False) -> QPolygonF:
+        pts = self._layer_array(layer)
+        if layer in SIMPLIFIED_LAYERS:
+            tolerance = SIMPLIFY_TOLERANCE_PX / (self.zoom * self._map_scale() * self.devicePixelRatioF())
+        else:
+            tolerance = 0.0
+        cached = self._layer_polygons.get((layer, closed))
+        if cached is not None and cached[0] == tolerance:
+            return cached[1]
+        if tolerance > 0.0 and pts.shape[0] > 2:
+            pts = np.asarray(LineString(pts).simplify(tolerance, preserve_topology=False).coords, dtype=np.float64)
+        polygon = polygon_from_array(pts)
+        if closed and not polygon.isEmpty():
+            polygon.append(polygon.first())
+        self._layer_polygons[(layer, closed)] = (tolerance, polygon)
+        return polygon
+
+    def _padded_layer_bounds(self, layer: str) -> QRectF:
+        if self._layer_array(layer).shape[0] == 0:
+            return QRectF()
+        bounds = self._layer_bounds_cache[layer]
+        # Pad by the largest marker radius plus pen width so markers and
+        # strokes on the hull are fully covered.
+        pad = SCENE_BOUNDS_PADDING / self._map_scale()
+        return bounds.adjusted(-pad, -pad, pad, pad)
+
+    def _scaled_background_image(self, rect: QRectF) -> QImage:
+        # Pre-scale the background to its on-screen size once instead of
+        # resampling the full image on every repaint. Only downscales are
+        # cached so zooming in cannot blow up the cached image. Sizes are in
+        # device pixels so HiDPI screens keep the full source resolution.
+        ratio = self.devicePixelRatioF()
+        target_w = int(round(rect.width() * self.zoom * ratio))
+        target_h = int(round(rect.height() * self.zoom * ratio))
+        image = self.background_image
+        if target_w <= 0 or target_h <= 0 or target_w >= image.width() or target_h >= image.height():
+            return image
+        # While the view is being dragged or zoomed, a fast nearest-neighbour
+        # scale stands in; the smooth one is built once interaction settles.
+        smooth = not self._is_interacting()
+        key = (target_w, target_h, ratio, smooth)
+        cached = self._scaled_background_key
+        if cached is not None and cached[:3] == key[:3] and (cached[3] or not smooth):
+            return self._scaled_background
+        mode = Qt.SmoothTransformation if smooth else Qt.FastTransformation
+        self._scaled_background = image.scaled(target_w, target_h, Qt.IgnoreAspectRatio, mode)
+        self._scaled_background.setDevicePixelRatio(ratio)
+        self._scaled_background_key = key
+        return self._scaled_background
+
+    def _is_interacting(self) -> bool:
+        return self.is_panning or self._zoom_settle_timer.isActive() or self.parent.has_active_drag()
 
     def map_to_scene(self, point: Sequence[float]) -> QPointF:
-        mapped = self._map_points_to_scene([point])
-        if not mapped:
+        rect = self._background_rect()
+        bg_w, bg_h = self.background_dimensions()
+        if bg_w <= 0 or bg_h <= 0:
             return QPointF(0.0, 0.0)
-        return mapped[0]
+        return QPointF(
+            rect.x() + float(point[0]) * rect.width() / bg_w,
+            rect.y() + float(point[1]) * rect.height() / bg_h,
+        )
 
     def scene_to_map(self, point: QPointF) -> QPointF:
         rect = self._background_rect()
@@ -155,62 +451,80 @@ class TrackCanvas(QWidget):
         )
 
     def _draw_grid(self, painter: QPainter, rect: QRectF):
-        painter.fillRect(rect, QColor(249, 246, 236))
+        painter.fillRect(rect, self._grid_fill)
         bg_w, bg_h = self.background_dimensions()
         minor_step_px = max(1.0, self.grid_spacing_m * self.px_per_m)
         major_step_px = minor_step_px * 5.0
         scale_x = rect.width() / max(bg_w, 1)
         scale_y = rect.height() / max(bg_h, 1)
 
-        minor_pen = QPen(QColor(223, 220, 210), 1)
-        major_pen = QPen(QColor(186, 182, 170), 1)
-
-        x = 0.0
-        while x <= bg_w:
-            scene_x = rect.x() + x * scale_x
-            painter.setPen(major_pen if abs((x / major_step_px) - round(x / major_step_px)) < 1e-6 else minor_pen)
-            painter.drawLine(QPointF(scene_x, rect.top()), QPointF(scene_x, rect.bottom()))
-            x += minor_step_px
-
-        y = 0.0
-        while y <= bg_h:
-            scene_y = rect.y() + y * scale_y
-            painter.setPen(major_pen if abs((y / major_step_px) - round(y / major_step_px)) < 1e-6 else minor_pen)
-            painter.drawLine(QPointF(rect.left(), scene_y), QPointF(rect.right(), scene_y))
-            y += minor_step_px
-
-        painter.setPen(QPen(QColor(120, 120, 120), 1))
+        # One drawLines call per pen instead of a drawLine round trip per grid
+        # line. Grid lines are axis-aligned hairlines, so antialiasing only
+        # costs coverage work without visibly improving them.
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        xs = np.arange(0.0, bg_w + 1e-9, minor_step_px)
+        ys = np.arange(0.0, bg_h + 1e-9, minor_step_px)
+        x_major = np.abs(xs / major_step_px - np.round(xs / major_step_px)) < 1e-6
+        y_major = np.abs(ys / major_step_px - np.round(ys / major_step_px)) < 1e-6
+        for pen, x_mask, y_mask in ((self._pen_grid_minor, ~x_major, ~y_major), (self._pen_grid_major, x_major, y_major)):
+            lines = [QLineF(scene_x, rect.top(), scene_x, rect.bottom()) for scene_x in (rect.x() + xs[x_mask] * scale_x).tolist()]
+            lines += [QLineF(rect.left(), scene_y, rect.right(), scene_y) for scene_y in (rect.y() + ys[y_mask] * scale_y).tolist()]
+            if lines:
+                painter.setPen(pen)
+                painter.drawLines(lines)
+
+        painter.setPen(self._pen_grid_border)
         painter.drawRect(rect)
+        painter.restore()
 
     def _draw_polyline(
         self,
         painter: QPainter,
-        points: Iterable[Sequence[float]],
-        color: QColor,
-        rect: QRectF,
-        width: int = 2,
+        layer: str,
+        pen: QPen,
         closed: bool = False,
-        style=Qt.SolidLine,
+        visible: QRectF | None = None,
     ):
-        pts = self._map_points_to_scene(points, rect)
-        if len(pts) < 2:
+        if self._layer_array(layer).shape[0] < 2:
             return
-        poly = QPolygonF(pts)
-        if closed:
-            poly.append(pts[0])
-        pen = QPen(color, width)
-        pen.setStyle(style)
+        if visible is not None and not visible.intersects(self._padded_layer_bounds(layer)):
+            return
+        poly = self._layer_polygon(layer, closed=closed)
         painter.setPen(pen)
         painter.drawPolyline(poly)
 
-    def _draw_points(self, painter: QPainter, points: Iterable[Sequence[float]], fill: QColor, rect: QRectF, radius: int = 5):
-        painter.setPen(QPen(QColor(0, 0, 0), 1))
-        painter.setBrush(fill)
-        for scene in self._map_points_to_scene(points, rect):
-            painter.drawEllipse(scene, radius, radius)
-
-    def _draw_arrow_handle(self, painter: QPainter, start: QPointF, end: QPointF, color: QColor):
-        painter.setPen(QPen(color, 2))
+    def _draw_points(
+        self,
+        painter: QPainter,
+        layer: str,
+        fill: QColor,
+        radius: int = 5,
+        visible: QRectF | None = None,
+    ):
+        pts = self._layer_array(layer)
+        if visible is not None and pts.shape[0]:
+            margin = (radius + 2.0) / self._map_scale()
+            inside = (
+                (pts[:, 0] >= visible.left() - margin)
+                & (pts[:, 0] <= visible.right() + margin)
+                & (pts[:, 1] >= visible.top() - margin)
+                & (pts[:, 1] <= visible.bottom() + margin)
+            )
+            pts = pts[inside]
+        if pts.shape[0] == 0:
+            return
+        # Markers are drawn as two batched round-capped point strokes (dark
+        # outline, then fill) instead of one drawEllipse call per marker.
+        centers = polygon_from_array(pts)
+        outline_pen, fill_pen = self._marker_pens(fill, radius)
+        painter.setPen(outline_pen)
+        painter.drawPoints(centers)
+        painter.setPen(fill_pen)
+        painter.drawPoints(centers)
+
+    def _draw_arrow_handle(self, painter: QPainter, start: QPointF, end: QPointF, pen: QPen, brush: QBrush):
+        painter.setPen(pen)
         painter.drawLine(start, end)
         direction = np.array([end.x() - start.x(), end.y() - start.y()], dtype=float)
         length = float(np.linalg.norm(direction))
@@ -222,7 +536,7 @@ class TrackCanvas(QWidget):
         base = np.array([end.x(), end.y()], dtype=float) - direction * head_size
         left = base + normal * (0.55 * head_size)
         right = base - normal * (0.55 * head_size)
-        painter.setBrush(color)
+        painter.setBrush(brush)
         painter.drawPolygon(QPolygonF([
             QPointF(float(end.x()), float(end.y())),
             QPointF(float(left[0]), float(left[1])),
@@ -239,23 +553,23 @@ class TrackCanvas(QWidget):
         y_axis = self.map_to_scene(gizmo["translate_y"])
         rotate = self.map_to_scene(gizmo["rotate"])
 
-        self._draw_arrow_handle(painter, center, x_axis, QColor(191, 66, 66))
-        self._draw_arrow_handle(painter, center, y_axis, QColor(52, 109, 191))
+        self._draw_arrow_handle(painter, center, x_axis, self._pen_gizmo_x, self._brush_gizmo_x)
+        self._draw_arrow_handle(painter, center, y_axis, self._pen_gizmo_y, self._brush_gizmo_y)
 
-        painter.setPen(QPen(QColor(76, 76, 76), 2, Qt.DashLine))
+        painter.setPen(self._pen_gizmo_rotate)
         painter.drawLine(center, rotate)
         radius = float(np.hypot(rotate.x() - center.x(), rotate.y() - center.y()))
         ring = QRectF(center.x() - radius, center.y() - radius, 2.0 * radius, 2.0 * radius)
         painter.drawArc(ring, 35 * 16, 290 * 16)
 
-        painter.setPen(QPen(QColor(35, 35, 35), 1))
-        painter.setBrush(QColor(255, 255, 255))
+        painter.setPen(self._pen_gizmo_outline)
+        painter.setBrush(self._brush_gizmo_center)
         painter.drawRect(QRectF(center.x() - 7.0, center.y() - 7.0, 14.0, 14.0))
-        painter.setBrush(QColor(191, 66, 66))
+        painter.setBrush(self._brush_gizmo_x)
         painter.drawEllipse(x_axis, 5, 5)
-        painter.setBrush(QColor(52, 109, 191))
+        painter.setBrush(self._brush_gizmo_y)
         painter.drawEllipse(y_axis, 5, 5)
-        painter.setBrush(QColor(91, 44, 143))
+        painter.setBrush(self._brush_gizmo_rotate)
         painter.drawEllipse(rotate, 6, 6)
 
     def transform_handle_at(self, screen_point: QPointF):
@@ -281,59 +595,101 @@ class TrackCanvas(QWidget):
                 return kind
         return None
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def _base_pixmap(self) -> QPixmap:
+        # The backdrop (fill, satellite image or grid) only depends on the view
+        # and background, so it is rendered offscreen once and blitted while
+        # vertices are dragged. The pixmap itself is reused while its size
+        # and device pixel ratio stay the same. A backdrop built mid-drag holds
+        # the fast-scaled image, so it is rebuilt once the interaction ends.
+        ratio = self.devicePixelRatioF()
+        smooth = not self._is_interacting()
+        key = (self.width(), self.height(), ratio, self.zoom, self.pan.x(), self.pan.y(), smooth)
+        cached = self._base_pixmap_key
+        if cached is None or cached[:6] != key[:6] or (smooth and not cached[6]) or self._base_pixmap_cache.isNull():
+            pixmap = self._base_pixmap_cache
+            if pixmap.isNull() or cached is None or cached[:3] != key[:3]:
+                pixmap = QPixmap(max(1, int(round(self.width() * ratio))), max(1, int(round(self.height() * ratio))))
+                pixmap.setDevicePixelRatio(ratio)
+            painter = QPainter(pixmap)
+            self._paint_base(painter)
+            painter.end()
+            self._base_pixmap_cache = pixmap
+            self._base_pixmap_key = key
+        return self._base_pixmap_cache
+
+    def _paint_base(self, painter: QPainter):
         painter.setRenderHint(QPainter.Antialiasing)
-        painter.fillRect(self.rect(), QColor(235, 235, 235))
+        painter.fillRect(self.rect(), self._view_fill)
         painter.translate(self.pan)
         painter.scale(self.zoom, self.zoom)
 
         rect = self._background_rect()
         if self.background_kind == "location" and not self.background_image.isNull():
-            painter.drawImage(rect, self.background_image)
+            painter.drawImage(rect, self._scaled_background_image(rect))
         else:
             self._draw_grid(painter, rect)
 
-        if len(self.allowed_area) >= 3:
-            polygon = QPolygonF(self._map_points_to_scene(self.allowed_area, rect))
-            painter.setPen(QPen(QColor(180, 65, 0), 2))
-            painter.setBrush(QColor(255, 177, 110, 70))
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self.is_panning or self._zoom_settle_timer.isActive():
+            # Every pan or zoom frame changes the backdrop, so caching it
+            # offscreen would only add a copy; paint it directly instead.
+            painter.save()
+            self._paint_base(painter)
+            painter.restore()
+        else:
+            painter.drawPixmap(0, 0, self._base_pixmap())
+        if self._map_coords.shape[0] == 0 and not self.transform_gizmo:
+            return
+        self._paint_overlay(painter, QRectF(event.rect()))
+
+    def _paint_overlay(self, painter: QPainter, damage: QRectF):
+        painter.setRenderHint(QPainter.Antialiasing)
+        transform = self._layer_transform()
+        visible = transform.inverted()[0].mapRect(damage)
+        painter.setTransform(transform)
+
+        if self.allowed_area.shape[0] >= 3 and visible.intersects(self._padded_layer_bounds("allowed_area")):
+            polygon = self._layer_polygon("allowed_area")
+            painter.setPen(self._pen_area)
+            painter.setBrush(self._brush_area)
             painter.drawPolygon(polygon)
-        elif len(self.allowed_area) >= 2:
-            self._draw_polyline(painter, self.allowed_area, QColor(180, 65, 0), rect, width=2)
+        elif self.allowed_area.shape[0] == 2:
+            self._draw_polyline(painter, "allowed_area", self._pen_area, visible=visible)
         self._draw_points(
             painter,
-            self.allowed_area,
-            QColor(255, 140, 0) if self.edit_target == "area" else QColor(209, 157, 88),
-            rect,
+            "allowed_area",
+            self._color_area_active if self.edit_target == "area" else self._color_area_inactive,
             radius=5,
+            visible=visible,
         )
 
         if self.centerline is not None:
-            self._draw_polyline(painter, self.centerline, QColor(16, 132, 86), rect, width=2, closed=False, style=Qt.DashLine)
+            self._draw_polyline(painter, "centerline", self._pen_centerline, visible=visible)
         if self.left_boundary is not None:
-            self._draw_polyline(painter, self.left_boundary, QColor(0, 76, 255), rect, width=2, closed=False)
+            self._draw_polyline(painter, "left_boundary", self._pen_left_boundary, visible=visible)
         if self.right_boundary is not None:
-            self._draw_polyline(painter, self.right_boundary, QColor(222, 186, 0), rect, width=2, closed=False)
+            self._draw_polyline(painter, "right_boundary", self._pen_right_boundary, visible=visible)
 
         if self.left_cones is not None:
             if self.edit_target == "cones":
-                self._draw_polyline(painter, self.left_cones, QColor(0, 76, 255), rect, width=1, closed=True)
-            self._draw_points(painter, self.left_cones, QColor(0, 76, 255), rect, radius=3)
+                self._draw_polyline(painter, "left_cones", self._pen_left_cone_ring, closed=True, visible=visible)
+            self._draw_points(painter, "left_cones", self._color_left_cone, radius=3, visible=visible)
         if self.right_cones is not None:
             if self.edit_target == "cones":
-                self._draw_polyline(painter, self.right_cones, QColor(222, 186, 0), rect, width=1, closed=True)
-            self._draw_points(painter, self.right_cones, QColor(222, 186, 0), rect, radius=3)
+                self._draw_polyline(painter, "right_cones", self._pen_right_cone_ring, closed=True, visible=visible)
+            self._draw_points(painter, "right_cones", self._color_right_cone, radius=3, visible=visible)
 
-        if self.control_points:
+        if self.control_points.shape[0]:
             self._draw_points(
                 painter,
-                self.control_points,
-                QColor(48, 176, 96) if self.edit_target == "track" else QColor(108, 156, 118),
-                rect,
+                "control_points",
+                self._color_track_active if self.edit_target == "track" else self._color_track_inactive,
                 radius=5,
+                visible=visible,
             )
 
+        painter.setTransform(self._view_transform())
         self._draw_transform_gizmo(painter)
 
     def wheelEvent(self, event):
@@ -345,6 +701,7 @@ class TrackCanvas(QWidget):
         new_screen_pos = QPointF(new_scene_pos.x() * self.zoom + self.pan.x(), new_scene_pos.y() * self.zoom + self.pan.y())
         delta = mouse_pos - new_screen_pos
         self.pan += delta
+        self._zoom_settle_timer.start(ZOOM_SETTLE_MS)
         self.update()
 
     def mousePressEvent(self, event):
@@ -365,11 +722,27 @@ class TrackCanvas(QWidget):
             self.update()
             return
         if self.parent.has_active_drag():
-            self.parent.handle_canvas_drag(self.screen_to_map(event.pos()))
+            # Mice can report far more moves than the screen refreshes; keep
+            # only the latest position and hand it over once per interval.
+            self._pending_drag_pos = self.screen_to_map(event.pos())
+            if not self._drag_timer.isActive():
+                self._drag_timer.start(DRAG_COALESCE_MS)
+
+    def _flush_pending_drag(self):
+        self._drag_timer.stop()
+        pos = self._pending_drag_pos
+        self._pending_drag_pos = None
+        if pos is not None and self.parent.has_active_drag():
+            self.parent.handle_canvas_drag(pos)
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MiddleButton:
             self.is_panning = False
             self.setCursor(Qt.ArrowCursor)
+            self.update()
             return
+        self._flush_pending_drag()
+        was_dragging = self.parent.has_active_drag()
         self.parent.handle_canvas_release(self.screen_to_map(event.pos()))
+        if was_dragging:
+            self.update()
@@ -85,11 +85,9 @@ def polyline_length_m(points: np.ndarray, px_per_m: float, closed: bool = False)
     arr = np.asarray(points, dtype=float)
     if arr.ndim != 2 or arr.shape[0] < 2:
         return 0.0
-    work = arr
+    length_px = float(np.sum(np.linalg.norm(np.diff(arr, axis=0), axis=1)))
     if closed and not np.allclose(arr[0], arr[-1]):
-        work = np.vstack((arr, arr[0]))
-    diffs = np.diff(work, axis=0)
-    length_px = float(np.sum(np.linalg.norm(diffs, axis=1)))
+        length_px += float(np.linalg.norm(arr[0] - arr[-1]))
     return length_px / float(px_per_m)
 
 
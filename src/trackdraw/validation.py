@@ -6,6 +6,12 @@ from typing import Dict, Iterable, Optional
 import numpy as np
 from shapely.geometry import LineString, Point, Polygon
 
+try:
+    from shapely import covers as _covers, points as _points
+except ImportError:  # Shapely < 2.0 has no vectorized predicates.
+    _covers = None
+    _points = None
+
 from .geometry import closed_loop_segment_lengths, points_to_array
 from .models import RuleSettings, TrackGeometry, ValidationIssue, ValidationResult
 
@@ -67,6 +73,15 @@ def _closed_line(points: np.ndarray) -> LineString:
     return LineString(arr)
 
 
+def _count_uncovered(polygon: Polygon, points: np.ndarray) -> int:
+    arr = np.asarray(points, dtype=float).reshape(-1, 2)
+    if arr.shape[0] == 0:
+        return 0
+    if _covers is None:
+        return sum(1 for x, y in arr if not polygon.covers(Point(float(x), float(y))))
+    return int(np.count_nonzero(~_covers(polygon, _points(arr))))
+
+
 def _cone_spacing_metrics(points: np.ndarray, px_per_m: float) -> np.ndarray:
     lengths_px = closed_loop_segment_lengths(points)
     return lengths_px / float(px_per_m) if lengths_px.size else np.array([], dtype=float)
@@ -169,14 +184,8 @@ def validate_track(
         )
 
     if enabled("cones_inside_area"):
-        outside = 0
-        boundary_outside = 0
-        for point in np.vstack((left_cones, right_cones)):
-            if not polygon.covers(Point(float(point[0]), float(point[1]))):
-                outside += 1
-        for point in np.vstack((left_boundary, right_boundary)):
-            if not polygon.covers(Point(float(point[0]), float(point[1]))):
-                boundary_outside += 1
+        outside = _count_uncovered(polygon, np.vstack((left_cones, right_cones)))
+        boundary_outside = _count_uncovered(polygon, np.vstack((left_boundary, right_boundary)))
         if outside or boundary_outside:
             result.issues.append(
                 make_issue(
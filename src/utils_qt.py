@@ -132,34 +132,35 @@ def _interpolate_on_closed_path(points: np.ndarray, cumulative: np.ndarray, segm
     return points[idx] + frac * (points[next_idx] - points[idx])
 
 
-def _cross_2d(a: np.ndarray, b: np.ndarray) -> float:
-    """Return the scalar 2D cross product of vectors a and b."""
-    return float(a[0] * b[1] - a[1] * b[0])
-
-
-def _segment_intersection(p1: np.ndarray,
-                          p2: np.ndarray,
-                          p3: np.ndarray,
-                          p4: np.ndarray,
-                          tol: float = 1e-9):
-    """Return (point, t, u) if segments p1-p2 and p3-p4 intersect, else None."""
-    r = p2 - p1
-    s = p4 - p3
-    denom = _cross_2d(r, s)
-    if abs(denom) < tol:
-        return None
-
-    diff = p3 - p1
-    t = _cross_2d(diff, s) / denom
-    u = _cross_2d(diff, r) / denom
+def _intersecting_segment_pairs(points: np.ndarray, tol: float, block_rows: int = 256):
+    """Yield (i, j, t, u) for every non-adjacent segment pair i < j of a closed path that intersects.
 
-    if -tol <= t <= 1.0 + tol and -tol <= u <= 1.0 + tol:
-        # Clamp within segment bounds to guard against floating error
-        t_clamped = min(max(t, 0.0), 1.0)
-        u_clamped = min(max(u, 0.0), 1.0)
-        point = p1 + t_clamped * r
-        return point, t_clamped, u_clamped
-    return None
+    All pairs are tested with array arithmetic, in row blocks to bound memory;
+    pairs come out in the same (i, j) order as a nested loop would produce.
+    """
+    n = len(points)
+    starts = points
+    vecs = np.roll(points, -1, axis=0) - points
+    cols = np.arange(n)
+    for row_start in range(0, n, block_rows):
+        rows = np.arange(row_start, min(row_start + block_rows, n))
+        r = vecs[rows][:, None, :]
+        s = vecs[None, :, :]
+        diff = starts[None, :, :] - starts[rows][:, None, :]
+        denom = r[..., 0] * s[..., 1] - r[..., 1] * s[..., 0]
+        valid = (cols[None, :] > rows[:, None] + 1) & ~((rows[:, None] == 0) & (cols[None, :] == n - 1))
+        valid &= np.abs(denom) >= tol
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (diff[..., 0] * s[..., 1] - diff[..., 1] * s[..., 0]) / denom
+            u = (diff[..., 0] * r[..., 1] - diff[..., 1] * r[..., 0]) / denom
+        valid &= (t >= -tol) & (t <= 1.0 + tol) & (u >= -tol) & (u <= 1.0 + tol)
+        for local_i, j in zip(*np.nonzero(valid)):
+            yield (
+                int(rows[local_i]),
+                int(j),
+                min(max(float(t[local_i, j]), 0.0), 1.0),
+                min(max(float(u[local_i, j]), 0.0), 1.0),
+            )
 
 
 def _find_self_intersections(points: np.ndarray,
@@ -175,55 +176,40 @@ def _find_self_intersections(points: np.ndarray,
         return []
 
     intersections: List[dict] = []
-    for i in range(n):
-        p1 = points[i]
-        p2 = points[(i + 1) % n]
-        for j in range(i + 1, n):
-            if j == i:
-                continue
-            if j == (i + 1) % n or i == (j + 1) % n:
-                continue  # adjacent segments share endpoints
-
-            q1 = points[j]
-            q2 = points[(j + 1) % n]
-
-            result = _segment_intersection(p1, p2, q1, q2, tol=tol)
-            if result is None:
-                continue
-
-            point, t_param, u_param = result
-            if segment_lengths[i] <= tol:
-                continue
-
-            distance = (cumulative[i] + t_param * segment_lengths[i]) % total_length
-            if total_length - distance < tol:
-                distance = 0.0
-
-            # Deduplicate intersections that land almost at existing vertices
-            if np.any(np.linalg.norm(points - point, axis=1) < tol):
-                continue
-
-            def _already_present(dist_val: float) -> bool:
-                for existing in intersections:
-                    if np.linalg.norm(existing["point"] - point) < dedup_tol:
-                        dist_diff = abs(existing["distance"] - dist_val)
-                        wrap_diff = min(dist_diff, total_length - dist_diff)
-                        if wrap_diff < dedup_progress_tol:
-                            return True
-                return False
-
-            if not _already_present(distance):
-                intersections.append({"point": point, "distance": distance})
-
-            if segment_lengths[j] <= tol:
-                continue
-
-            distance_j = (cumulative[j] + u_param * segment_lengths[j]) % total_length
-            if total_length - distance_j < tol:
-                distance_j = 0.0
-
-            if not _already_present(distance_j):
-                intersections.append({"point": point, "distance": distance_j})
+    for i, j, t_param, u_param in _intersecting_segment_pairs(points, tol):
+        point = points[i] + t_param * (points[(i + 1) % n] - points[i])
+        if segment_lengths[i] <= tol:
+            continue
+
+        distance = (cumulative[i] + t_param * segment_lengths[i]) % total_length
+        if total_length - distance < tol:
+            distance = 0.0
+
+        # Deduplicate intersections that land almost at existing vertices
+        if np.any(np.linalg.norm(points - point, axis=1) < tol):
+            continue
+
+        def _already_present(dist_val: float) -> bool:
+            for existing in intersections:
+                if np.linalg.norm(existing["point"] - point) < dedup_tol:
+                    dist_diff = abs(existing["distance"] - dist_val)
+                    wrap_diff = min(dist_diff, total_length - dist_diff)
+                    if wrap_diff < dedup_progress_tol:
+                        return True
+            return False
+
+        if not _already_present(distance):
+            intersections.append({"point": point, "distance": distance})
+
+        if segment_lengths[j] <= tol:
+            continue
+
+        distance_j = (cumulative[j] + u_param * segment_lengths[j]) % total_length
+        if total_length - distance_j < tol:
+            distance_j = 0.0
+
+        if not _already_present(distance_j):
+            intersections.append({"point": point, "distance": distance_j})
 
     if not intersections:
         return []
@@ -291,9 +277,10 @@ def generate_variable_offset_boundaries(centerline: np.ndarray,
     widths_m = width_sampler(progress)
     widths_px = widths_m * px_per_m
 
-    left_pts = []
-    right_pts = []
     n = len(base_points)
+    # Preallocate n + 1 rows so the loops can be closed without a vstack copy
+    left_pts = np.empty((n + 1, 2), dtype=float)
+    right_pts = np.empty((n + 1, 2), dtype=float)
     for i in range(n):
         prev_idx = (i - 1) % n
         next_idx = (i + 1) % n
@@ -311,14 +298,12 @@ def generate_variable_offset_boundaries(centerline: np.ndarray,
         tangent_unit = tangent / norm
         normal = np.array([-tangent_unit[1], tangent_unit[0]])
         half_width = widths_px[i] / 2.0
-        left_pts.append(base_points[i] + normal * half_width)
-        right_pts.append(base_points[i] - normal * half_width)
-
-    left_pts = np.asarray(left_pts)
-    right_pts = np.asarray(right_pts)
-    # Close the loops by appending the first point
-    left_pts = np.vstack((left_pts, left_pts[0]))
-    right_pts = np.vstack((right_pts, right_pts[0]))
+        left_pts[i] = base_points[i] + normal * half_width
+        right_pts[i] = base_points[i] - normal * half_width
+
+    # Close the loops by repeating the first point
+    left_pts[n] = left_pts[0]
+    right_pts[n] = right_pts[0]
     return left_pts, right_pts
 
 
@@ -2,15 +2,23 @@ import os
 import sys
 import tempfile
 import unittest
+from unittest import mock
 
 import numpy as np
+from shapely.geometry import Point, Polygon
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 SRC = os.path.join(ROOT, "src")
 if SRC not in sys.path:
     sys.path.insert(0, SRC)
 
+from PyQt5.QtCore import QRectF
+from PyQt5.QtWidgets import QApplication, QWidget
+
 from parameter_function import ParameterFunction
+from trackdraw.canvas import TrackCanvas
 from trackdraw.configuration import discover_location_configs, load_rule_settings, load_track_defaults
 from trackdraw.exporter import transform_points_to_export_frame
 from trackdraw.generator import generate_control_points
@@ -19,6 +27,7 @@ from trackdraw.importer import load_track_csv
 from trackdraw.models import BackgroundSpec, GeneratorSettings, ProjectState, TrackOverlay
 from trackdraw.project_io import load_project, save_project
 from trackdraw.validation import build_default_rules, validate_track
+from utils_qt import _closed_path_metrics, _find_self_intersections, _intersecting_segment_pairs
 
 
 class ConfigurationTests(unittest.TestCase):
@@ -144,6 +153,108 @@ class ValidationTests(unittest.TestCase):
         self.assertGreater(geometry.min_radius_m, 5.0)
         self.assertEqual(result.error_count, 0)
 
+    def test_geometry_outside_area_is_counted(self):
+        width = ParameterFunction(3.0, name="Track Width")
+        spacing = ParameterFunction(3.5, name="Cone Spacing")
+        control_points = [(140.0, 120.0), (360.0, 120.0), (360.0, 300.0), (140.0, 300.0)]
+        geometry = build_track_geometry(control_points, px_per_m=10.0, n_points_midline=250, width_function=width, cone_spacing_function=spacing)
+        allowed_area = [(60.0, 60.0), (250.0, 60.0), (250.0, 360.0), (60.0, 360.0)]
+        polygon = Polygon(allowed_area)
+        cones = list(geometry.left_cones) + list(geometry.right_cones)
+        samples = list(geometry.left_boundary) + list(geometry.right_boundary)
+        cones_outside = sum(1 for x, y in cones if not polygon.covers(Point(x, y)))
+        samples_outside = sum(1 for x, y in samples if not polygon.covers(Point(x, y)))
+        self.assertEqual((cones_outside, samples_outside), (26, 248))
+        expected = f"{cones_outside} cones and {samples_outside} boundary samples fall outside the allowed area polygon."
+
+        result = validate_track(allowed_area, geometry, 10.0, build_default_rules())
+        issues = [issue for issue in result.issues if issue.rule_id == "cones_inside_area"]
+        self.assertEqual([issue.detail for issue in issues], [expected])
+
+        with mock.patch("trackdraw.validation._covers", None):
+            result = validate_track(allowed_area, geometry, 10.0, build_default_rules())
+        issues = [issue for issue in result.issues if issue.rule_id == "cones_inside_area"]
+        self.assertEqual([issue.detail for issue in issues], [expected])
+
+
+class SelfIntersectionTests(unittest.TestCase):
+    def assert_crossing(self, points, expected_pairs, expected_distances):
+        pairs = list(_intersecting_segment_pairs(points, 1e-6))
+        self.assertEqual([(i, j) for i, j, _, _ in pairs], expected_pairs)
+        for _, _, t_param, u_param in pairs:
+            self.assertAlmostEqual(t_param, 0.5)
+            self.assertAlmostEqual(u_param, 0.5)
+
+        cumulative, segment_lengths, total_length = _closed_path_metrics(points)
+        intersections = _find_self_intersections(points, cumulative, segment_lengths, total_length)
+        self.assertEqual(len(intersections), len(expected_distances))
+        for found, distance in zip(intersections, expected_distances):
+            np.testing.assert_allclose(found["point"], [5.0, 5.0], atol=1e-9)
+            self.assertAlmostEqual(found["distance"], distance)
+
+    def test_figure_eight_crossing(self):
+        points = np.array([(0.0, 0.0), (10.0, 10.0), (10.0, 0.0), (0.0, 10.0)])
+        diagonal = 10.0 * np.sqrt(2.0)
+        self.assert_crossing(points, [(0, 2)], [diagonal / 2.0, 10.0 + 1.5 * diagonal])
+
+    def test_crossing_beyond_first_row_block(self):
+        # Edge subdivisions use odd counts so the crossing never lands on a
+        # vertex; the long first edge pushes it past the default 256-row block.
+        def edge(start, end, count):
+            return np.linspace(start, end, count, endpoint=False)
+
+        points = np.vstack(
+            (
+                edge((10.0, 10.0), (10.0, 0.0), 300),
+                edge((10.0, 0.0), (0.0, 10.0), 101),
+                edge((0.0, 10.0), (0.0, 0.0), 101),
+                edge((0.0, 0.0), (10.0, 10.0), 101),
+            )
+        )
+        diagonal = 10.0 * np.sqrt(2.0)
+        self.assert_crossing(points, [(350, 552)], [10.0 + diagonal / 2.0, 20.0 + 1.5 * diagonal])
+
+
+class CanvasLayerBoundsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def assert_layer_bounds(self, canvas, layers):
+        for layer, points in layers.items():
+            points = np.asarray(points, dtype=float).reshape(-1, 2)
+            if points.shape[0] == 0:
+                self.assertTrue(canvas._padded_layer_bounds(layer).isEmpty(), layer)
+                continue
+            lo = points.min(axis=0)
+            hi = points.max(axis=0)
+            self.assertEqual(canvas._layer_bounds_cache[layer], QRectF(lo[0], lo[1], hi[0] - lo[0], hi[1] - lo[1]), layer)
+
+    def test_packed_bounds_with_empty_and_missing_layers(self):
+        parent = QWidget()
+        canvas = TrackCanvas(parent)
+        canvas.resize(400, 300)
+        rng = np.random.default_rng(3)
+        layers = {
+            "allowed_area": rng.random((5, 2)) * 300.0,
+            "control_points": [],
+            "centerline": None,
+            "left_boundary": rng.random((40, 2)) * 200.0 + 50.0,
+            "right_boundary": np.empty((0, 2)),
+            "left_cones": [(12.0, 34.0)],
+            "right_cones": np.empty((0, 2)),
+        }
+        canvas.update_scene(*layers.values(), "area")
+        self.assert_layer_bounds(canvas, {layer: [] if points is None else points for layer, points in layers.items()})
+
+        layers.update(
+            centerline=rng.random((30, 2)) * 100.0,
+            left_cones=np.empty((0, 2)),
+            right_cones=rng.random((9, 2)) * 80.0 - 20.0,
+        )
+        canvas.update_scene(*layers.values(), "area")
+        self.assert_layer_bounds(canvas, {layer: [] if points is None else points for layer, points in layers.items()})
+
 
 class GeneratorTests(unittest.TestCase):
     def test_generator_is_deterministic_for_same_seed(self):